@@ -6,6 +6,7 @@ import subprocess
 import contextlib
 from pathlib import Path
 from collections import deque
+from typing import Callable
 
 import aiofiles
 from werkzeug.local import LocalProxy
@@ -136,6 +137,11 @@ class Capture:
             yield self
 
         self._capturing = False
+
+        # wake up async readers waiting for more output so they can see the end
+        for out_file in (self.out_file, self.err_file):
+            if isinstance(out_file, _MemoryOut):
+                out_file.notify()
     
     def _collect_outputs(self):
         fds = []
@@ -203,11 +209,14 @@ class _MemoryPath:
 
 class _MemoryOut:
     
-    def __init__(self, lines=None):
-        self._lines = lines or []
+    def __init__(self, lines=None, waiters=None):
+        self._lines = lines if lines is not None else []
         self._trailing = None
 
         self._i_line = 0
+
+        # (loop, future) of async readers waiting for more lines, shared with clones
+        self._waiters = waiters if waiters is not None else set()
     
     def read(self):
         return ''.join(self._lines)
@@ -225,10 +234,15 @@ class _MemoryOut:
                 self._lines.append(self._trailing)
                 self._trailing = None
 
+        n_lines = len(self._lines)
+
         self._lines.extend(lines)
         
         if self._lines and not self._lines[-1].endswith('\n'):
             self._trailing = self._lines.pop()
+
+        if self._waiters and len(self._lines) != n_lines:
+            self.notify()
     
     def close(self):
         pass
@@ -241,9 +255,31 @@ class _MemoryOut:
     
     async def readline_async(self):
         return self.readline()
+
+    async def wait_async(self, until: Callable[[], bool] = None):
+        """
+        Wait until there are unread lines or `until()` is true.
+        """
+        loop = asyncio.get_running_loop()
+        waiter = (loop, loop.create_future())
+        self._waiters.add(waiter)
+        try:
+            # check after registering the waiter so a concurrent write is not missed
+            if self._i_line < len(self._lines) or (until and until()):
+                return
+            await waiter[1]
+        finally:
+            self._waiters.discard(waiter)
+
+    def notify(self):
+        for loop, future in tuple(self._waiters):
+            try:
+                loop.call_soon_threadsafe(_resolve_future, future)
+            except RuntimeError:  # loop closed
+                pass
     
     def clone(self):
-        return _MemoryOut(self._lines)
+        return _MemoryOut(self._lines, self._waiters)
     
     def __enter__(self):
         return self
@@ -283,6 +319,7 @@ class _OutAccessor:
     
     async def iter_async(self, f, nowait: bool = False):
         prev_capturing = self._capture._capturing
+        finished = lambda: prev_capturing and not self._capture._capturing
         
         if hasattr(f, 'readline_async'):
             async def readline():
@@ -291,17 +328,23 @@ class _OutAccessor:
             async def readline():
                 return await f.readline()
 
+        if hasattr(f, 'wait_async'):
+            async def wait():
+                await f.wait_async(until=finished)
+        else:
+            async def wait():
+                await asyncio.sleep(0.01)
+
         while True:
+            # check before reading so lines written right before finish are not lost
+            ended = finished()
             line = await readline()
             if line:
                 yield line
-            elif nowait:
+            elif nowait or ended:
                 break
             else:
-                await asyncio.sleep(0.01)
-
-            if prev_capturing and not self._capture._capturing:
-                break
+                await wait()
     
     @contextlib.asynccontextmanager
     async def open_async(self):
@@ -319,6 +362,11 @@ class _OutAccessor:
             await asyncio.sleep(0.01)
 
 
+def _resolve_future(future):
+    if not future.done():
+        future.set_result(None)
+
+
 def _setup_out(out, name, kwargs={}):
     out_file = None
     out_path = None
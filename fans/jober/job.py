@@ -1,4 +1,4 @@
-import uuid
+import os
 import time
 import queue
 import shutil
@@ -19,6 +19,12 @@ logger = get_logger(__name__)
 
 class Job:
 
+    __slots__ = (
+        'target', 'id', 'name', 'extra',
+        'max_instances', 'max_recent_runs', 'disabled', 'volatile', 'capture', 'capture_trace', 'on_event',
+        'runs_count', '_work_dir', '_id_to_run', '_recent_runs',
+    )
+
     def __init__(
             self,
             target: any = noop,
@@ -31,12 +37,13 @@ class Job:
             disabled: bool = False,
             volatile: bool = False,
             capture: str|tuple[str,str] = 'default',
+            capture_trace: bool = True,
             on_event=noop,
             root_work_dir: Path = None,
             **__,
     ):
         self.target = target
-        self.id = id or name or uuid.uuid4().hex
+        self.id = id or name or os.urandom(16).hex()
         self.name = name or self.id
         self.extra = extra
         
@@ -45,6 +52,7 @@ class Job:
         self.disabled = disabled
         self.volatile = volatile
         self.capture = capture
+        self.capture_trace = capture_trace
         self.on_event = on_event
         
         self.runs_count = 0
@@ -140,6 +148,7 @@ class Job:
             kwargs=kwargs,
             stdout=stdout,
             stderr=stderr,
+            capture_trace=self.capture_trace,
             on_event=self._on_run_event,
         )
 
@@ -5,7 +5,6 @@ import logging
 import tempfile
 import traceback
 import threading
-import functools
 import contextlib
 import multiprocessing
 from pathlib import Path
@@ -36,6 +35,7 @@ class Jober:
         'timezone': 'Asia/Shanghai',
         'max_recent_runs': 3,
         'capture': 'default',
+        'capture_trace': True,
         'jobs': [],
     }
 
@@ -144,6 +144,10 @@ class Jober:
         options.setdefault('on_event', lambda event: self._events_queue.put(event))
         options.setdefault('root_work_dir', self.work_dir)
         options.setdefault('capture', self.conf.capture)
+
+        # capture_trace: bool - whether to format traceback of failed run into `run.trace`
+        options.setdefault('capture_trace', self.conf.capture_trace)
+
         options.setdefault('service', False)
 
         job = Job(Target.make(target, **options), **options)
@@ -252,14 +256,24 @@ class Jober:
         self._id_to_job[job.id] = job
 
     def _collect_events(self):
-        queue = self._events_queue
+        events_queue = self._events_queue
         while True:
-            event = queue.get()
-            for listener in self._listeners:
+            # block for the first event, then drain what is already queued so that
+            # a burst (e.g. status changes of a short run) is handled in one wake-up
+            events = [events_queue.get()]
+            while True:
                 try:
-                    listener(event)
-                except:
-                    traceback.print_exc()
+                    events.append(events_queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            listeners = self._listeners
+            for event in events:
+                for listener in listeners:
+                    try:
+                        listener(event)
+                    except:
+                        traceback.print_exc()
     
     def _load_jobs_from_conf(self):
         for spec in self.conf.get('jobs', []):
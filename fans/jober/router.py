@@ -1,9 +1,9 @@
-import json
 import uuid
 import asyncio
 from collections import deque
 from typing import Optional, Any
 
+import orjson
 from fastapi import APIRouter, Request, Response, HTTPException
 from sse_starlette.sse import EventSourceResponse
 from pydantic import BaseModel, Field, create_model
@@ -84,10 +84,10 @@ async def logs_(
                     async for line in out.iter_async(f, nowait=True):
                         lines.append(line)
                     for line in lines:
-                        yield {'data': json.dumps({'line': line})}
+                        yield {'data': orjson.dumps({'line': line}).decode()}
 
                 async for line in out.iter_async(f):
-                    yield {'data': json.dumps({'line': line})}
+                    yield {'data': orjson.dumps({'line': line}).decode()}
 
         return EventSourceResponse(gen())
     else:
@@ -101,17 +101,18 @@ async def logs_(
 
 
 @app.get('/events')
-async def events_(request: Request):
+async def events_():
     """Subscribe to events"""
     async def gen():
         topic = uuid.uuid4().hex
         jober = Jober.get_instance()
         with jober.listen(lambda event: jober.pubsub.publish(topic, event)):
-            yield {'data': json.dumps(jober._init_events())}
+            yield {'data': orjson.dumps(jober._init_events()).decode()}
             async with jober.pubsub.subscribe(topic).async_events as events:
-                while not await request.is_disconnected():
+                # no disconnect polling, EventSourceResponse cancels us when client leaves
+                while True:
                     _, event = await events.get()
-                    yield {'data': json.dumps(event)}
+                    yield {'data': orjson.dumps(event).decode()}
     return EventSourceResponse(gen())
 
 
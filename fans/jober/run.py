@@ -17,6 +17,12 @@ logger = get_logger(__name__)
 
 
 class Run:
+
+    __slots__ = (
+        'target', 'job_id', 'run_id', 'args', 'kwargs', 'on_event',
+        'status', 'beg_time', 'end_time', 'trace', 'result', 'native_id',
+        '_before_run', 'capture', 'capture_trace',
+    )
     
     class Status(enum.StrEnum):
         
@@ -35,6 +41,7 @@ class Run:
         kwargs=None,
         stdout: str = ':memory:',
         stderr: str = ':stdout:',
+        capture_trace: bool = True,
         on_event=noop,
     ):
         if args is not None or kwargs is not None:
@@ -57,6 +64,7 @@ class Run:
 
         self._before_run = noop
         self.capture = Capture(stdout=stdout, stderr=stderr, should_enable_disable=False)
+        self.capture_trace = capture_trace
     
     def __call__(self):
         try:
@@ -102,19 +110,20 @@ class Run:
         return ret
     
     def _set_status(self, status):
+        now = time.time()
         if status == Run.Status.running:
-            self.beg_time = time.time()
+            self.beg_time = now
         elif status in FINISHED_STATUSES:
-            if status == Run.Status.error:
+            if status == Run.Status.error and self.capture_trace:
                 self.trace = traceback.format_exc()
-            self.end_time = time.time()
+            self.end_time = now
 
         self.status = status
         
         self.on_event({
             'type': 'run_status',
             'status': status,
-            'time': time.time(),
+            'time': now,
             'job_id': self.job_id,
             'run_id': self.run_id,
         })
@@ -122,6 +131,8 @@ class Run:
 
 class DummyRun(Run):
 
+    __slots__ = ()
+
     def __init__(self, job_id='dummy', run_id='dummy'):
         target = Target.make(noop)
         super().__init__(target=target, job_id=job_id, run_id=run_id)
@@ -5,6 +5,7 @@ import runpy
 import base64
 import pickle
 import hashlib
+import functools
 import subprocess
 import importlib.util
 from pathlib import Path
@@ -275,23 +276,28 @@ def _get_impl_cls(source: Union[Callable, str, List[str]], **options):
     elif callable(source):
         return PythonCallableTarget
     elif isinstance(source, str):
-        parts = shlex.split(source)
-        if not parts:
-            raise ValueError(f'invalid source "{source}"')
-        if len(parts) == 1:
-            if ':' in source:
-                domain_str, func_str = source.split(':')
-                if domain_str.endswith('.py'):
-                    return PythonScriptCallableTarget
-                else:
-                    return PythonModuleCallableTarget
-            elif source.endswith('.py'):
-                return PythonScriptTarget
-            elif not source.startswith('.') and '.' in source:
-                return PythonModuleTarget
-        return CommandTarget
+        return _get_impl_cls_by_str(source)
     else:
         raise ValueError(f'invalid target: source="{source}" options={options}')
+
+
+@functools.lru_cache(maxsize=1024)
+def _get_impl_cls_by_str(source: str):
+    parts = shlex.split(source)
+    if not parts:
+        raise ValueError(f'invalid source "{source}"')
+    if len(parts) == 1:
+        if ':' in source:
+            domain_str, func_str = source.split(':')
+            if domain_str.endswith('.py'):
+                return PythonScriptCallableTarget
+            else:
+                return PythonModuleCallableTarget
+        elif source.endswith('.py'):
+            return PythonScriptTarget
+        elif not source.startswith('.') and '.' in source:
+            return PythonModuleTarget
+    return CommandTarget
     
 
 def _reprint_proc_stdout(proc):
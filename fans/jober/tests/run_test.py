@@ -12,3 +12,14 @@ def test_collect_traceback():
     run()
     assert run.status == 'error'
     assert 'oops' in run.trace
+
+
+def test_no_capture_trace():
+
+    def func():
+        raise RuntimeError('oops')
+
+    run = Run(Target.make(func), capture_trace=False)
+    run()
+    assert run.status == 'error'
+    assert run.trace is None
@@ -19,9 +19,9 @@ You can use `app.state.setup` to assign jober spec, like:
         spec = '/home/fans656/enos/.fme/jober/conf.yaml',
     ))
 """
-import json
 import asyncio
 
+import orjson
 import aiofiles
 from fastapi import FastAPI, HTTPException, Request, Body
 from starlette.responses import JSONResponse
@@ -184,10 +184,11 @@ async def job_logs(
 
 
 @app.get('/api/job/events')
-async def api_get_events(request: Request):
+async def api_get_events():
     async def gen():
         async with Jober.get_instance().pubsub.subscribe().async_events as events:
-            while not await request.is_disconnected():
+            # no disconnect polling, EventSourceResponse cancels us when client leaves
+            while True:
                 event = await events.get()
-                yield {'data': json.dumps(event)}
+                yield {'data': orjson.dumps(event).decode()}
     return EventSourceResponse(gen())
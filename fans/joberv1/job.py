@@ -5,15 +5,18 @@ https://stackoverflow.com/questions/5947742/how-to-change-the-output-color-of-ec
 redirect output of thread:
 https://stackoverflow.com/questions/14890997/redirect-stdout-to-a-file-only-for-a-specific-thread
 """
-import json
-import uuid
+import os
+import time
 import shlex
 import shutil
+import bisect
+import functools
 import pathlib
 import tempfile
 import traceback
 from typing import Iterable, Union, Callable, List
 
+import orjson
 from fans.fn import noop, parse_int
 from fans.path import Path
 from fans.logger import get_logger
@@ -24,6 +27,10 @@ from .run import Run, DummyRun
 
 logger = get_logger(__name__)
 
+# seconds to reuse `Job.info()` / `Job.latest_run` before re-scanning `root_dir`
+INFO_CACHE_TTL = 2.0
+LATEST_RUN_CACHE_TTL = 1.0
+
 
 class Job:
 
@@ -44,7 +51,7 @@ class Job:
             on_retry: Callable[['Job'], None] = None,
     ):
         self.name = name
-        self.id = id or name or uuid.uuid4().hex
+        self.id = id or name or os.urandom(16).hex()
         self.cmd = cmd
         self.script = script
         self.module = module
@@ -55,6 +62,7 @@ class Job:
         self.retry = self.parse_retry(retry)
         self.config = config or {}
         self.root_dir = self.ensure_root_dir(self.config.get('runs_dir'))
+        self.reload_run_ids()
         self.on_event = on_event or noop
         self.on_retry = on_retry or noop
 
@@ -74,6 +82,9 @@ class Job:
         self.run_id_to_active_run = {}
         self.sched_job_id_to_sched_job = {}
 
+        self._info_cache = (0.0, None)
+        self._latest_run_cache = (0.0, None)
+
     def __call__(self, context = None):
         run = self.prepare_run(context = context)
         self.run_id_to_active_run[run.id] = run
@@ -98,6 +109,7 @@ class Job:
             'job_id': self.id,
             'next_run_time': self.next_run_time,
         })
+        self.invalidate_caches()
         self.on_event(event)
 
     def process_exit(self, run):
@@ -111,6 +123,10 @@ class Job:
             self.on_retry(self, run)
 
     def info(self):
+        ts, info = self._info_cache
+        if info is not None and time.monotonic() - ts < INFO_CACHE_TTL:
+            return info
+        latest_run = self.latest_run
         ret = {
             'type': self.type,
             'name': self.name,
@@ -118,17 +134,25 @@ class Job:
             'cmd': self.cmd,
             'module': self.module,
             'args': self.args,
-            'status': self.status,
-            'error': self.error,
-            'beg': Timestamp.to_datetime_str(self.beg),
-            'end': Timestamp.to_datetime_str(self.end),
+            'status': latest_run.status,
+            'error': latest_run.error,
+            'beg': Timestamp.to_datetime_str(latest_run.beg),
+            'end': Timestamp.to_datetime_str(latest_run.end),
             'next_run_time': self.next_run_time,
             'sched': self.sched,
             'retry': self.retry,
             'config': self.config,
         }
+        self._info_cache = (time.monotonic(), ret)
         return ret
 
+    def invalidate_caches(self):
+        """
+        Drop cached `info()` and `latest_run`, called on run status changes.
+        """
+        self._info_cache = (0.0, None)
+        self._latest_run_cache = (0.0, None)
+
     def get_run_by_id(self, id):
         return next((run for run in self.runs if run.id == id), None)
 
@@ -165,25 +189,43 @@ class Job:
 
     @property
     def latest_run(self):
-        return next(self.runs, dummy_run)
+        ts, run = self._latest_run_cache
+        if run is None or time.monotonic() - ts >= LATEST_RUN_CACHE_TTL:
+            run = self._get_run(self._run_ids[-1]) if self._run_ids else dummy_run
+            self._latest_run_cache = (time.monotonic(), run)
+        return run
 
     @property
     def runs(self):
-        for path in sorted(self.root_dir.iterdir(), reverse = True):
-            run_id = path.name
-            if run_id in self.run_id_to_active_run:
-                # active run, attrs (e.g. status) will change over time
-                yield self.run_id_to_active_run[run_id]
-            else:
-                # archived run, attrs already fixed
-                yield Run.from_archived(path)
+        for run_id in self._run_ids[::-1]:
+            yield self._get_run(run_id)
+
+    def _get_run(self, run_id):
+        run = self.run_id_to_active_run.get(run_id)
+        if run:
+            # active run, attrs (e.g. status) will change over time
+            return run
+        else:
+            # archived run, attrs already fixed
+            return Run.from_archived(self.root_dir / run_id)
+
+    def reload_run_ids(self):
+        """
+        Re-scan `root_dir` for run IDs, needed only if runs are changed externally.
+        """
+        self._run_ids = sorted(path.name for path in self.root_dir.iterdir())
+        self.invalidate_caches()
 
     def parse_args(self, args):
         if args is None:
             return ()
+        if type(args) is tuple:
+            return args
+        if type(args) is list:
+            return tuple(args)
         if isinstance(args, str):
             return shlex.split(args)
-        if isinstance(args, [tuple, list]):
+        if isinstance(args, (tuple, list)):
             return tuple(args)
         raise RuntimeError(f'invalid args {args}')
 
@@ -191,7 +233,7 @@ class Job:
         if value is None:
             return {}
         if isinstance(value, str):
-            return json.loads(value)
+            return orjson.loads(value)
         if isinstance(value, dict):
             return value
         raise RuntimeError(f'invalid {hint or "value"} {value}')
@@ -226,15 +268,19 @@ class Job:
             logger.warning(f'invalid value for limit.archived.runs: {value}')
             return
         if limit > 0:
-            run_paths = list(self.root_dir.iterdir())
-            if len(run_paths) >= limit:
-                for path in sorted(run_paths)[0:len(run_paths) - limit + 1]:
-                    shutil.rmtree(path)
+            n_removed = len(self._run_ids) - limit + 1
+            if n_removed > 0:
+                for run_id in self._run_ids[:n_removed]:
+                    shutil.rmtree(self.root_dir / run_id, ignore_errors = True)
+                del self._run_ids[:n_removed]
+                self.invalidate_caches()
 
     def make_run(self, context = None):
         run_id = make_run_id()
         run_dir = self.root_dir / run_id
         run_dir.ensure_dir()
+        bisect.insort(self._run_ids, run_id)
+        self.invalidate_caches()
         return Run(
             {
                 'type': self.type,
@@ -278,14 +324,24 @@ def split_trailing_args(value):
 
 
 def format_datetime_for_fname(dt):
-    tz_str = dt.strftime('%z')[:5]
-    tz_str = tz_str.replace('+', '_')
-    tz_str = tz_str.replace('-', '__')
-    return dt.strftime('%Y%m%d_%H%M%S_%f') + tz_str
+    return dt.strftime('%Y%m%d_%H%M%S_%f') + _tz_suffix_for_fname(dt.utcoffset())
+
+
+@functools.lru_cache(maxsize = None)
+def _tz_suffix_for_fname(offset):
+    """
+    `+0800` => `_0800`, `-0500` => `__0500`, naive datetime => empty string
+    """
+    if offset is None:
+        return ''
+    seconds = int(offset.total_seconds())
+    sign = '_' if seconds >= 0 else '__'
+    hours, minutes = divmod(abs(seconds) // 60, 60)
+    return f'{sign}{hours:02}{minutes:02}'
 
 
 def make_run_id():
-    random_part = uuid.uuid4().hex[:8]
+    random_part = os.urandom(4).hex()
     return format_datetime_for_fname(native_now()) + '_' + random_part
 
 